@@ -2,12 +2,20 @@
 Holds the Pydantic BaseModels and distribution objects for various probaility distributions.
 """
 
-from typing import Any, Dict, Literal, Optional, Protocol, Union
+from functools import partial
+from typing import Annotated, Any, Callable, Dict, Literal, Optional, Protocol, Union
 import random
 import math
 
 import numpy as np
-from pydantic import BaseModel, Field, ConfigDict, model_validator
+from pydantic import (
+    BaseModel,
+    Field,
+    ConfigDict,
+    Discriminator,
+    Tag,
+    model_validator,
+)
 from scipy.stats import truncnorm
 
 
@@ -45,6 +53,26 @@ class QuadraticParams(FunctionParams):
     c: float
 
 
+def _constant_function(value: float, _x: float) -> float:
+    """Constant function: value."""
+    return value
+
+
+def _linear_function(slope: float, intercept: float, x: float) -> float:
+    """Linear function: slope * x + intercept."""
+    return slope * x + intercept
+
+
+def _exponential_function(base: float, rate: float, x: float) -> float:
+    """Exponential function: base * exp(rate * x)."""
+    return base * math.exp(rate * x)
+
+
+def _quadratic_function(a: float, b: float, c: float, x: float) -> float:
+    """Quadratic function: a * x^2 + b * x + c."""
+    return a * (x**2) + b * x + c
+
+
 class FunctionConfig(BaseModel):
     """Configuration for a mathematical function."""
 
@@ -68,6 +96,25 @@ class FunctionConfig(BaseModel):
             raise ValueError("Quadratic function requires QuadraticParams")
         return self
 
+    def compile(self) -> Callable[[float], float]:
+        """
+        Return a callable that evaluates this function at a given x value.
+
+        The params are bound once, so callers that keep the returned callable skip
+        the dispatch on type and the lookups into params on each evaluation. For a
+        single evaluation, _evaluate_function is cheaper.
+        """
+        params = self.params
+        if self.type == "constant":
+            return partial(_constant_function, params.value)
+        if self.type == "linear":
+            return partial(_linear_function, params.slope, params.intercept)
+        if self.type == "exponential":
+            return partial(_exponential_function, params.base, params.rate)
+        if self.type == "quadratic":
+            return partial(_quadratic_function, params.a, params.b, params.c)
+        raise ValueError(f"Unsupported function type: {self.type}")
+
 
 class NoiseFunctionConfig(BaseModel):
     """Configuration for the noise function."""
@@ -271,12 +318,37 @@ class BernoulliBasedDist(BaseModel):
     mean_function: FunctionConfig
 
 
-Distribution = Union[
-    NormalDist,
-    LogNormalDist,
-    TruncatedNormalDist,
-    FunctionBasedDist,
-    BernoulliBasedDist,
+def _distribution_tag(value: Any) -> Optional[str]:
+    """
+    Return the Distribution union member tag for a config dict or model instance.
+
+    Parametric distributions are tagged by their "type" key. Function-based and
+    Bernoulli-based distributions have no type field, so they are told apart by
+    whether a noise function is given. Returns None for anything else, which
+    Pydantic reports as a validation error.
+    """
+    if isinstance(value, dict):
+        if "type" in value:
+            return value["type"]
+        return "function_based" if "noise_function" in value else "bernoulli_based"
+    if isinstance(value, FunctionBasedDist):
+        return "function_based"
+    if isinstance(value, BernoulliBasedDist):
+        return "bernoulli_based"
+    return getattr(value, "type", None)
+
+
+# Discriminated so validation dispatches straight to one member instead of
+# trying each in turn
+Distribution = Annotated[
+    Union[
+        Annotated[NormalDist, Tag("normal")],
+        Annotated[LogNormalDist, Tag("lognormal")],
+        Annotated[TruncatedNormalDist, Tag("truncated_normal")],
+        Annotated[FunctionBasedDist, Tag("function_based")],
+        Annotated[BernoulliBasedDist, Tag("bernoulli_based")],
+    ],
+    Discriminator(_distribution_tag),
 ]
 
 # Tuple for isinstance(); typing.Union cannot be used with isinstance on Python < 3.10.
@@ -355,55 +427,8 @@ def _sample(dist: Distribution, field_value: float = 0) -> float:
         mean_value = _evaluate_function(dist.mean_function, field_value)
 
         # Then add the noise
-        if dist.noise_function.type == "normal":
-            scale = dist.noise_function.params["scale_factor"]
-            if isinstance(scale, FunctionConfig):
-                scale_value = _evaluate_function(scale, field_value)
-            else:
-                scale_value = scale
-            return mean_value + random.gauss(0, scale_value)
-
-        if dist.noise_function.type == "lognormal":
-            scale = dist.noise_function.params["scale_factor"]
-            if isinstance(scale, FunctionConfig):
-                scale_value = _evaluate_function(scale, field_value)
-            else:
-                scale_value = scale
-
-            # For lognormal noise, we use a different parameterization to handle large values
-            # We want the noise to be multiplicative rather than additive for large values
-            noise_factor = math.exp(
-                random.gauss(0, math.log1p(scale_value / mean_value))
-            )
-            return mean_value * noise_factor
-
-        if dist.noise_function.type == "truncated_normal":
-            scale = dist.noise_function.params["scale_factor"]
-            if isinstance(scale, FunctionConfig):
-                scale_value = _evaluate_function(scale, field_value)
-            else:
-                scale_value = scale
-            lower = dist.noise_function.params["lower"]
-            upper = dist.noise_function.params["upper"]
-            # Generate noise between lower and upper bounds
-            rng = np.random.RandomState(random.randint(0, 2**32 - 1))
-            noise = float(
-                truncnorm.rvs(
-                    (lower - 0) / scale_value,  # a = (lower - loc) / scale
-                    (upper - 0) / scale_value,  # b = (upper - loc) / scale
-                    loc=0,  # center at 0
-                    scale=scale_value,
-                    random_state=rng,
-                )
-            )
-            if noise < 0:
-                raise ValueError(
-                    f"Got negative noise value: {noise} for truncated normal with lower={lower}"
-                )
-            return mean_value + noise
-        raise NotImplementedError(
-            f"FunctionBasedDist sampling not implemented for noise type: {dist.noise_function.type}"
-        )
+        scale_value = _evaluate_noise_scale(dist.noise_function, field_value)
+        return _sample_noise(dist.noise_function, mean_value, scale_value)
 
     if isinstance(dist, BernoulliBasedDist):
         # For Bernoulli distribution, we use the probability parameter from the mean_function
@@ -412,6 +437,55 @@ def _sample(dist: Distribution, field_value: float = 0) -> float:
     raise ValueError(f"No sampler implemented for distribution type: {dist.type}")
 
 
+def _evaluate_noise_scale(noise_function: NoiseFunctionConfig, x: float) -> float:
+    """Helper function to evaluate the scale factor of a noise function configuration."""
+    scale = noise_function.params["scale_factor"]
+    if isinstance(scale, FunctionConfig):
+        return _evaluate_function(scale, x)
+    return scale
+
+
+def _sample_noise(
+    noise_function: NoiseFunctionConfig, mean_value: float, scale_value: float
+) -> float:
+    """
+    Apply noise drawn from a noise function configuration to an evaluated mean.
+    Uses Python's random module for consistency across all distributions.
+    """
+    if noise_function.type == "normal":
+        return mean_value + random.gauss(0, scale_value)
+
+    if noise_function.type == "lognormal":
+        # For lognormal noise, we use a different parameterization to handle large values
+        # We want the noise to be multiplicative rather than additive for large values
+        noise_factor = math.exp(random.gauss(0, math.log1p(scale_value / mean_value)))
+        return mean_value * noise_factor
+
+    if noise_function.type == "truncated_normal":
+        lower = noise_function.params["lower"]
+        upper = noise_function.params["upper"]
+        # Generate noise between lower and upper bounds
+        rng = np.random.RandomState(random.randint(0, 2**32 - 1))
+        noise = float(
+            truncnorm.rvs(
+                (lower - 0) / scale_value,  # a = (lower - loc) / scale
+                (upper - 0) / scale_value,  # b = (upper - loc) / scale
+                loc=0,  # center at 0
+                scale=scale_value,
+                random_state=rng,
+            )
+        )
+        if noise < 0:
+            raise ValueError(
+                f"Got negative noise value: {noise} for truncated normal with lower={lower}"
+            )
+        return mean_value + noise
+
+    raise NotImplementedError(
+        f"FunctionBasedDist sampling not implemented for noise type: {noise_function.type}"
+    )
+
+
 def _evaluate_function(func: FunctionConfig, x: float) -> float:
     """Helper function to evaluate a function configuration."""
     if func.type == "constant":
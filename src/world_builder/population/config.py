@@ -12,11 +12,10 @@ The config is a JSON file that contains the following fields:
 """
 
 from typing import Dict, List
-import json
 from pathlib import Path
 import math
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, model_validator
 from typing_extensions import Self
 
 from world_builder.distributions_config import (
@@ -315,13 +314,16 @@ class PopulationConfig(BaseModel):
 def load_config(config_filepath: Path) -> PopulationConfig:
     """
     Loads the JSON configuration file and validates each distribution.
+
+    The raw bytes are handed straight to Pydantic, which parses and validates them
+    in one pass instead of building an intermediate dict with the json module.
     """
-    with open(config_filepath, "r", encoding="utf-8") as f:
-        try:
-            config_json = json.load(f)
-        except json.JSONDecodeError as e:
+    config_bytes = Path(config_filepath).read_bytes()
+    try:
+        return PopulationConfig.model_validate_json(config_bytes)
+    except ValidationError as e:
+        if any(error["type"] == "json_invalid" for error in e.errors()):
             raise ValueError(
                 f"Tried to load {config_filepath} into JSON object and failed. Check to ensure it the file provided is valid JSON."
             ) from e
-    population_config = PopulationConfig(**config_json)
-    return population_config
+        raise
@@ -2,17 +2,43 @@
 Module for generating net worth values for characters based on their professions.
 """
 
-from typing import Optional, Dict, Any
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, Tuple
 import random
 import math
 
+import numpy as np
+from scipy.stats import truncnorm
+
 from world_builder.population.net_worth_config import NetWorthConfig
 from world_builder.distributions_config import (
+    FunctionBasedDist,
     FunctionConfig,
-    sample_from_config,
+    NoiseFunctionConfig,
+    _evaluate_noise_scale,
+    _sample_noise,
 )
 from world_builder.population.character import Character
 
+# Maps each asset type to the NetWorth attribute holding its value.
+ASSET_VALUE_FIELDS: Dict[str, str] = {
+    "primary_residence": "primary_residence_value",
+    "other_properties": "other_properties_net_value",
+    "starships": "starships_net_value",
+    "speeders": "speeders_net_value",
+    "other_vehicles": "other_vehicles_net_value",
+    "luxury_property": "luxury_property_net_value",
+    "galactic_stock": "galactic_stock_net_value",
+    "business": "business_net_value",
+}
+
+# Asset attributes of a NetWorth for a profession with no assets configured.
+_EMPTY_ASSET_ATTRIBUTES: Dict[str, Any] = {
+    field: None
+    for asset_type, value_field in ASSET_VALUE_FIELDS.items()
+    for field in (f"owns_{asset_type}", value_field)
+}
+
 
 class NetWorth:
     """
@@ -28,8 +54,13 @@ class NetWorth:
         For each asset type (e.g. "primary_residence", "starships", etc.):
         - owns_{asset_type}: Whether the character owns this type of asset
         - {asset_type}_value: The value of the asset if owned (or {asset_type}_net_value for some types)
+
+    All attributes live in a single dict held in a slot, so instances carry no
+    per-instance ``__dict__`` and cannot gain new attributes after creation.
     """
 
+    __slots__ = ("_values",)
+
     def __init__(
         self,
         character_id: str,
@@ -46,39 +77,27 @@ class NetWorth:
             currency_type: The type of currency
             **attributes: Additional attributes to set (e.g. owns_primary_residence, primary_residence_value)
         """
-        super().__setattr__("_initializing", True)
-        super().__setattr__("_attribute_names", set())
-
-        self._set_initial_attr("character_id", character_id)
-        self._set_initial_attr("liquid_currency", liquid_currency)
-        self._set_initial_attr("currency_type", currency_type)
-
+        values = {
+            "character_id": character_id,
+            "liquid_currency": liquid_currency,
+            "currency_type": currency_type,
+        }
         for name, value in attributes.items():
             if not name.startswith("_"):
-                self._set_initial_attr(name, value)
+                values[name] = value
 
-        super().__setattr__("_initializing", False)
-
-    def _set_initial_attr(self, name: str, value: Any) -> None:
-        """Helper method for setting initial attributes during initialization."""
-        private_name = f"_{name}"
-        super().__setattr__(private_name, value)
-        self._attribute_names.add(name)
-        self._attribute_names.add(private_name)
+        object.__setattr__(self, "_values", values)
 
     def __getattr__(self, name: str) -> Any:
         """
-        Provides access to attributes via properties.
+        Provides access to the stored attributes.
         This is called when an attribute is not found through normal lookup.
         """
-        if name.startswith("_"):
-            raise AttributeError(
-                f"'{type(self).__name__}' object has no attribute '{name}'"
-            )
-
-        private_name = f"_{name}"
-        if hasattr(self, private_name):
-            return getattr(self, private_name)
+        if not name.startswith("_"):
+            try:
+                return self._values[name]
+            except KeyError:
+                pass
 
         raise AttributeError(
             f"'{type(self).__name__}' object has no attribute '{name}'"
@@ -88,27 +107,29 @@ class NetWorth:
         """
         Prevents modification of attributes after initialization.
         """
-        if name in ("_attribute_names", "_initializing"):
-            super().__setattr__(name, value)
-            return
-
-        if hasattr(self, "_initializing") and self._initializing:
-            super().__setattr__(name, value)
-            return
-
         raise AttributeError(
             f"Can't set attribute '{name}' - NetWorth objects are immutable after initialization"
         )
 
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns the NetWorth attributes as a new dict, in the order they were set.
+        """
+        return dict(self._values)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Returns the stored attributes for pickling."""
+        return self._values
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restores the stored attributes when unpickling."""
+        object.__setattr__(self, "_values", state)
+
     def __repr__(self) -> str:
         """
         Returns a string representation of the NetWorth instance.
         """
-        attrs = []
-        for name in sorted(self._attribute_names):
-            if not name.startswith("_"):
-                value = getattr(self, name)
-                attrs.append(f"{name}={value!r}")
+        attrs = [f"{name}={self._values[name]!r}" for name in sorted(self._values)]
         return f"NetWorth({', '.join(attrs)})"
 
     def __eq__(self, other: object) -> bool:
@@ -117,11 +138,7 @@ class NetWorth:
         """
         if not isinstance(other, NetWorth):
             return NotImplemented
-        return all(
-            getattr(self, name) == getattr(other, name)
-            for name in self._attribute_names
-            if not name.startswith("_")
-        )
+        return self._values == other._values
 
 
 def evaluate_function(func_config: FunctionConfig, x: float) -> float:
@@ -150,62 +167,146 @@ def evaluate_function(func_config: FunctionConfig, x: float) -> float:
     raise ValueError(f"Unknown function type: {func_config.type}")
 
 
-def _generate_asset_value(
-    character: Character,
-    has_config: Optional[Dict[str, Any]],
-    value_config: Optional[Dict[str, Any]],
-    profession: str,
-    asset_type: str,
-) -> tuple[Optional[bool], Optional[float]]:
+@dataclass(frozen=True)
+class NetWorthParams:
+    """
+    Net worth distribution parameters evaluated for a single character.
+
+    Built by prepare_net_worth_params so that repeated draws for the same
+    character reuse the evaluated functions instead of walking the config again.
+    Per-asset fields are parallel tuples indexed like asset_types.
+
+    Attributes:
+        currency_type: The type of currency to report
+        liquid_mean: Mean liquid currency
+        liquid_scale: Noise scale of the liquid currency
+        liquid_noise: Noise function for the liquid currency
+        asset_types: Asset types with an ownership distribution for the profession
+        probabilities: Ownership probability for each asset type, clipped to [0, 1]
+        value_means: Mean value for each asset type (NaN if no value distribution)
+        value_scales: Noise scale for each asset type (NaN if no value distribution)
+        value_noise: Noise function for each asset type (None if no value distribution)
+    """
+
+    currency_type: str
+    liquid_mean: float
+    liquid_scale: float
+    liquid_noise: NoiseFunctionConfig
+    asset_types: Tuple[str, ...]
+    probabilities: Tuple[float, ...]
+    value_means: Tuple[float, ...]
+    value_scales: Tuple[float, ...]
+    value_noise: Tuple[Optional[NoiseFunctionConfig], ...]
+
+
+def _evaluate_function_based(
+    dist: FunctionBasedDist, character: Character
+) -> tuple[float, float]:
+    """Evaluate the mean and noise scale of a function-based distribution for a character."""
+    field_value = getattr(character, dist.field_name)
+    mean_value = evaluate_function(dist.mean_function, field_value)
+    scale_value = _evaluate_noise_scale(dist.noise_function, field_value)
+    return mean_value, scale_value
+
+
+def prepare_net_worth_params(
+    character: Character, config: NetWorthConfig
+) -> NetWorthParams:
     """
-    Helper function to generate ownership and value for an asset type.
+    Evaluate all net worth distribution parameters for a character.
 
     Args:
-        character: The character to generate for
-        has_config: The configuration for asset ownership probability
-        value_config: The configuration for asset value distribution
-        profession: The character's profession
-        asset_type: The type of asset to generate for
+        character: The character to generate net worth for
+        config: The net worth configuration containing profession-based functions
 
     Returns:
-        A tuple of (owns_asset, asset_value) where both could be None
+        A NetWorthParams holding the evaluated parameters
+
+    Raises:
+        ValueError: If the character's profession is not found in the config
     """
-    owns_asset = None
-    asset_value = None
+    if character.profession not in config.profession_liquid_currency:
+        raise ValueError(
+            f"Character profession '{character.profession}' not found in net worth config"
+        )
 
-    if (
-        has_config is not None
-        and asset_type in has_config
-        and profession in has_config[asset_type]
-    ):
-        residence_config = has_config[asset_type][profession]
-        field_value = getattr(character, residence_config.field_name)
-        probability = evaluate_function(residence_config.mean_function, field_value)
+    profession = character.profession
+    prof_config = config.profession_liquid_currency[profession]
+    liquid_mean, liquid_scale = _evaluate_function_based(prof_config, character)
+
+    has_config = config.profession_has or {}
+    value_config = config.profession_value or {}
+    asset_types = []
+    probabilities = []
+    value_means = []
+    value_scales = []
+    value_noise = []
+    for asset_type in ASSET_VALUE_FIELDS:
+        has_dist = has_config.get(asset_type, {}).get(profession)
+        if has_dist is None:
+            continue
+
+        probability = evaluate_function(
+            has_dist.mean_function, getattr(character, has_dist.field_name)
+        )
+        value_dist = value_config.get(asset_type, {}).get(profession)
+        if value_dist is None:
+            mean_value, scale_value, noise = math.nan, math.nan, None
+        else:
+            mean_value, scale_value = _evaluate_function_based(value_dist, character)
+            noise = value_dist.noise_function
+
+        asset_types.append(asset_type)
         # Ensure probability is between 0 and 1
-        probability = max(0.0, min(1.0, probability))
-        owns_asset = random.random() < probability
+        probabilities.append(max(0.0, min(1.0, probability)))
+        value_means.append(mean_value)
+        value_scales.append(scale_value)
+        value_noise.append(noise)
+
+    return NetWorthParams(
+        currency_type=config.metadata.get("currency", "credits"),
+        liquid_mean=liquid_mean,
+        liquid_scale=liquid_scale,
+        liquid_noise=prof_config.noise_function,
+        asset_types=tuple(asset_types),
+        probabilities=tuple(probabilities),
+        value_means=tuple(value_means),
+        value_scales=tuple(value_scales),
+        value_noise=tuple(value_noise),
+    )
+
+
+# Noise types that leave the mean unchanged when their scale is zero
+_EXACT_AT_ZERO_SCALE = frozenset({"normal", "lognormal"})
 
-        # If they own the asset, generate its value
-        if owns_asset and value_config is not None:
-            if asset_type in value_config and profession in value_config[asset_type]:
-                value_config_data = value_config[asset_type][profession]
-                field_value = getattr(character, value_config_data.field_name)
-                config_dict = value_config_data.model_dump()
-                config_dict["type"] = "function_based"
-                asset_value = sample_from_config(config_dict, field_value)
-                # Ensure the value is positive
-                asset_value = max(0, asset_value)
 
-    return owns_asset, asset_value
+def _sample_value(
+    noise: NoiseFunctionConfig, mean_value: float, scale_value: float
+) -> float:
+    """
+    Sample around an evaluated mean, skipping the RNG when the noise scale is zero.
+
+    Zero-scale normal and lognormal noise always returns the mean, so the draw
+    is skipped and the random module's state is left untouched.
+    """
+    if scale_value == 0 and noise.type in _EXACT_AT_ZERO_SCALE:
+        return mean_value
+    return _sample_noise(noise, mean_value, scale_value)
 
 
-def generate_net_worth(character: Character, config: NetWorthConfig) -> NetWorth:
+def generate_net_worth(
+    character: Character,
+    config: NetWorthConfig,
+    params: Optional[NetWorthParams] = None,
+) -> NetWorth:
     """
     Generate a net worth value for a character based on their profession.
 
     Args:
         character: The character to generate net worth for
         config: The net worth configuration containing profession-based functions
+        params: Optional parameters from prepare_net_worth_params for this character
+            and config; pass them when drawing repeatedly for the same character
 
     Returns:
         A NetWorth object with the generated values
@@ -213,105 +314,165 @@ def generate_net_worth(character: Character, config: NetWorthConfig) -> NetWorth
     Raises:
         ValueError: If the character's profession is not found in the config
     """
-    if character.profession not in config.profession_liquid_currency:
-        raise ValueError(
-            f"Character profession '{character.profession}' not found in net worth config"
-        )
+    if params is None:
+        params = prepare_net_worth_params(character, config)
 
-    prof_config = config.profession_liquid_currency[character.profession]
-
-    field_value = getattr(character, prof_config.field_name)
+    liquid_currency = _sample_value(
+        params.liquid_noise, params.liquid_mean, params.liquid_scale
+    )
+    liquid_currency = max(0, liquid_currency)
 
-    config_dict = prof_config.model_dump()
-    config_dict["type"] = "function_based"
-    liquid_currency = sample_from_config(config_dict, field_value)
+    attributes = dict(_EMPTY_ASSET_ATTRIBUTES)
+    for asset_type, probability, mean_value, scale_value, noise in zip(
+        params.asset_types,
+        params.probabilities,
+        params.value_means,
+        params.value_scales,
+        params.value_noise,
+    ):
+        owns_asset = random.random() < probability
+        asset_value = None
 
-    liquid_currency = max(0, liquid_currency)
+        # If they own the asset, generate its value
+        if owns_asset and noise is not None:
+            asset_value = _sample_value(noise, mean_value, scale_value)
+            # Ensure the value is positive
+            asset_value = max(0, asset_value)
 
-    currency_type = config.metadata.get("currency", "credits")
+        attributes[f"owns_{asset_type}"] = owns_asset
+        attributes[ASSET_VALUE_FIELDS[asset_type]] = asset_value
 
-    owns_primary_residence, primary_residence_value = _generate_asset_value(
-        character,
-        config.profession_has,
-        config.profession_value,
-        character.profession,
-        "primary_residence",
+    return NetWorth(
+        character_id=character.character_id,
+        liquid_currency=liquid_currency,
+        currency_type=params.currency_type,
+        **attributes,
     )
 
-    owns_other_properties, other_properties_net_value = _generate_asset_value(
-        character,
-        config.profession_has,
-        config.profession_value,
-        character.profession,
-        "other_properties",
-    )
 
-    owns_starships, starships_net_value = _generate_asset_value(
-        character,
-        config.profession_has,
-        config.profession_value,
-        character.profession,
-        "starships",
-    )
+def _apply_noise_batch(
+    noise_config: NoiseFunctionConfig,
+    mean_value: float,
+    scale_value: float,
+    standard_normals: np.ndarray,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """
+    Turn pre-drawn standard normal deviates into samples around an evaluated mean.
 
-    owns_speeders, speeders_net_value = _generate_asset_value(
-        character,
-        config.profession_has,
-        config.profession_value,
-        character.profession,
-        "speeders",
-    )
+    Vectorized counterpart of the scalar noise sampler: normal and lognormal
+    noise are the affine transform mean + scale * X of the given deviates.
+    Truncated normal noise cannot reuse them and is drawn from rng instead.
 
-    owns_other_vehicles, other_vehicles_net_value = _generate_asset_value(
-        character,
-        config.profession_has,
-        config.profession_value,
-        character.profession,
-        "other_vehicles",
-    )
+    Args:
+        noise_config: The noise function configuration
+        mean_value: The evaluated mean
+        scale_value: The evaluated noise scale
+        standard_normals: Standard normal deviates, one per sample
+        rng: NumPy random generator for noise types that need their own draws
 
-    owns_luxury_property, luxury_property_net_value = _generate_asset_value(
-        character,
-        config.profession_has,
-        config.profession_value,
-        character.profession,
-        "luxury_property",
-    )
+    Returns:
+        A float64 array with one sample per deviate
+    """
+    if noise_config.type == "normal":
+        return mean_value + scale_value * standard_normals
+
+    if noise_config.type == "lognormal":
+        sigma = math.log1p(scale_value / mean_value)
+        return mean_value * np.exp(sigma * standard_normals)
+
+    if noise_config.type == "truncated_normal":
+        lower = noise_config.params["lower"]
+        upper = noise_config.params["upper"]
+        noise = truncnorm.rvs(
+            lower / scale_value,
+            upper / scale_value,
+            loc=0,
+            scale=scale_value,
+            size=standard_normals.shape,
+            random_state=rng,
+        )
+        if np.any(noise < 0):
+            raise ValueError(
+                f"Got negative noise value for truncated normal with lower={lower}"
+            )
+        return mean_value + noise
 
-    owns_galactic_stock, galactic_stock_net_value = _generate_asset_value(
-        character,
-        config.profession_has,
-        config.profession_value,
-        character.profession,
-        "galactic_stock",
+    raise NotImplementedError(
+        f"FunctionBasedDist sampling not implemented for noise type: {noise_config.type}"
     )
 
-    owns_business, business_net_value = _generate_asset_value(
-        character,
-        config.profession_has,
-        config.profession_value,
-        character.profession,
-        "business",
-    )
 
-    return NetWorth(
-        character_id=character.character_id,
-        liquid_currency=liquid_currency,
-        currency_type=currency_type,
-        owns_primary_residence=owns_primary_residence,
-        primary_residence_value=primary_residence_value,
-        owns_other_properties=owns_other_properties,
-        other_properties_net_value=other_properties_net_value,
-        owns_starships=owns_starships,
-        starships_net_value=starships_net_value,
-        owns_speeders=owns_speeders,
-        speeders_net_value=speeders_net_value,
-        owns_other_vehicles=owns_other_vehicles,
-        other_vehicles_net_value=other_vehicles_net_value,
-        owns_luxury_property=owns_luxury_property,
-        luxury_property_net_value=luxury_property_net_value,
-        owns_galactic_stock=owns_galactic_stock,
-        galactic_stock_net_value=galactic_stock_net_value,
-        owns_business=owns_business,
-        business_net_value=business_net_value,
+def generate_net_worth_batch(
+    character: Character,
+    config: NetWorthConfig,
+    n: int,
+    seed: Optional[int] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Generate n independent net worth samples for a single character.
+
+    All distribution parameters are evaluated once for the character. The
+    uniforms for every ownership draw and the standard normals for every
+    value are then drawn up front in one block each, rather than building n
+    NetWorth objects one at a time. Truncated normal noise cannot reuse those
+    normals, so each column that uses it (liquid currency or an asset value)
+    costs one extra truncnorm.rvs call.
+
+    Args:
+        character: The character to generate net worth for
+        config: The net worth configuration containing profession-based functions
+        n: Number of samples to draw
+        seed: Optional seed for the NumPy random generator
+
+    Returns:
+        A dict of column arrays of length n: "liquid_currency", plus
+        "owns_{asset_type}" (bool) and the asset's value column (float, NaN
+        where not owned or where the asset has no value distribution) for every
+        asset type configured for the profession
+
+    Raises:
+        ValueError: If n < 1 or the character's profession is not found in the config
+    """
+    if n < 1:
+        raise ValueError("n must be >= 1")
+
+    params = prepare_net_worth_params(character, config)
+    rng = np.random.default_rng(seed)
+    num_assets = len(params.asset_types)
+
+    # Row 0 drives liquid currency; row i + 1 drives the value of asset i.
+    standard_normals = rng.standard_normal((num_assets + 1, n))
+    owns_assets = rng.random((num_assets, n)) < np.asarray(
+        params.probabilities
+    ).reshape(num_assets, 1)
+
+    liquid_currency = _apply_noise_batch(
+        params.liquid_noise,
+        params.liquid_mean,
+        params.liquid_scale,
+        standard_normals[0],
+        rng,
     )
+    columns: Dict[str, np.ndarray] = {
+        "liquid_currency": np.maximum(0.0, liquid_currency)
+    }
+
+    for i, asset_type in enumerate(params.asset_types):
+        owns_asset = owns_assets[i]
+
+        asset_value = np.full(n, np.nan)
+        if params.value_noise[i] is not None:
+            owned_values = _apply_noise_batch(
+                params.value_noise[i],
+                params.value_means[i],
+                params.value_scales[i],
+                standard_normals[i + 1][owns_asset],
+                rng,
+            )
+            asset_value[owns_asset] = np.maximum(0.0, owned_values)
+
+        columns[f"owns_{asset_type}"] = owns_asset
+        columns[ASSET_VALUE_FIELDS[asset_type]] = asset_value
+
+    return columns
@@ -0,0 +1,169 @@
+"""
+Shared fixtures for the world builder tests.
+"""
+
+import random
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pytest
+
+from world_builder.population.net_worth_config import NetWorthConfig, load_config
+from world_builder.distributions_config import (
+    FunctionBasedDist,
+    FunctionConfig,
+    NoiseFunctionConfig,
+    LinearParams,
+    ConstantParams,
+    BernoulliBasedDist,
+)
+
+# Farmer asset parameters for all_assets_config:
+# (ownership slope, ownership intercept, value slope, value intercept,
+#  noise slope, noise intercept), all linear in age
+FARMER_ASSET_PARAMS = {
+    "primary_residence": (0.02, 0.1, 1000, 50000, 100, 5000),
+    "other_properties": (0.01, 0.05, 500, 25000, 50, 2500),
+    "starships": (0.005, 0.01, 2000, 100000, 200, 10000),
+    "speeders": (0.015, 0.05, 300, 15000, 30, 1500),
+    "other_vehicles": (0.01, 0.03, 400, 20000, 40, 2000),
+    "luxury_property": (0.008, 0.02, 3000, 150000, 300, 15000),
+    "galactic_stock": (0.012, 0.04, 800, 40000, 80, 4000),
+    "business": (0.01, 0.03, 2500, 125000, 250, 12500),
+}
+
+
+def _linear(slope, intercept):
+    """Linear function config of the form slope * x + intercept."""
+    return FunctionConfig(
+        type="linear", params=LinearParams(slope=slope, intercept=intercept)
+    )
+
+
+def _age_linear_dist(slope, intercept, noise_slope, noise_intercept):
+    """Function-based distribution linear in age with linear normal noise."""
+    return FunctionBasedDist(
+        field_name="age",
+        mean_function=_linear(slope, intercept),
+        noise_function=NoiseFunctionConfig(
+            type="normal",
+            params={
+                "field_name": "age",
+                "scale_factor": _linear(noise_slope, noise_intercept),
+            },
+        ),
+    )
+
+
+CONFIG_DIR = Path(__file__).resolve().parent / "config"
+
+# Farmer liquid currency: mean 5 * age + 100 with noise scale 0.1 * age
+FARMER_LIQUID_MEAN = _linear(5, 100)
+FARMER_LIQUID_NOISE = NoiseFunctionConfig(
+    type="normal",
+    params={"field_name": "age", "scale_factor": _linear(0.1, 0)},
+)
+FARMER_LIQUID_DIST = FunctionBasedDist(
+    field_name="age",
+    mean_function=FARMER_LIQUID_MEAN,
+    noise_function=FARMER_LIQUID_NOISE,
+)
+
+# Normal noise with a constant zero scale, so samples equal the mean
+ZERO_NOISE = NoiseFunctionConfig(
+    type="normal",
+    params={
+        "field_name": "age",
+        "scale_factor": FunctionConfig(type="constant", params=ConstantParams(value=0)),
+    },
+)
+
+
+def _farmer_config(currency: Optional[str]) -> NetWorthConfig:
+    """Net worth config for farmers only in the given currency (None for no metadata)."""
+    return NetWorthConfig(
+        profession_liquid_currency={"farmer": FARMER_LIQUID_DIST},
+        metadata={} if currency is None else {"currency": currency},
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _seed_random():
+    """Seed the global random generators once so unseeded tests are reproducible."""
+    random.seed(0)
+    np.random.seed(0)
+
+
+@pytest.fixture(scope="session")
+def config_dir():
+    """Directory holding the world builder test config files."""
+    return CONFIG_DIR
+
+
+@pytest.fixture(scope="session")
+def nw_micro_config():
+    """The nw_config_micro.json net worth config, loaded once per session."""
+    return load_config(CONFIG_DIR / "nw_config_micro.json")
+
+
+@pytest.fixture(scope="session")
+def farmer_config_credits():
+    """Net worth config with liquid currency in credits for farmers only."""
+    return _farmer_config("credits")
+
+
+@pytest.fixture(scope="session")
+def farmer_config_imperial():
+    """Net worth config with liquid currency in imperial credits for farmers only."""
+    return _farmer_config("imperial_credits")
+
+
+@pytest.fixture(scope="session")
+def farmer_config_no_currency():
+    """Net worth config for farmers only with no currency in its metadata."""
+    return _farmer_config(None)
+
+
+@pytest.fixture(scope="session")
+def sith_config():
+    """Net worth config with a constant, noise-free liquid currency for Sith."""
+    return NetWorthConfig(
+        profession_liquid_currency={
+            "Sith": FunctionBasedDist(
+                field_name="age",
+                mean_function=FunctionConfig(
+                    type="constant", params=ConstantParams(value=100000)
+                ),
+                noise_function=ZERO_NOISE,
+            )
+        },
+        metadata={"currency": "imperial_credits"},
+    )
+
+
+@pytest.fixture(scope="session")
+def farmer_asset_params():
+    """FARMER_ASSET_PARAMS, the per-asset parameters of all_assets_config."""
+    return FARMER_ASSET_PARAMS
+
+
+@pytest.fixture(scope="session")
+def all_assets_config():
+    """Net worth config for farmers covering every asset type."""
+    return NetWorthConfig(
+        profession_liquid_currency={"farmer": FARMER_LIQUID_DIST},
+        profession_has={
+            asset_type: {
+                "farmer": BernoulliBasedDist(
+                    field_name="age", mean_function=_linear(slope, intercept)
+                )
+            }
+            for asset_type, (slope, intercept, *_) in FARMER_ASSET_PARAMS.items()
+        },
+        profession_value={
+            asset_type: {"farmer": _age_linear_dist(*value_params)}
+            for asset_type, (_, _, *value_params) in FARMER_ASSET_PARAMS.items()
+        },
+        metadata={"currency": "credits"},
+    )
@@ -1,5 +1,3 @@
-from pathlib import Path
-
 import pytest
 from pydantic import ValidationError
 
@@ -10,9 +8,6 @@ from world_builder.distributions_config import (
     is_distribution,
 )
 
-parent_dir = Path(__file__).resolve().parent
-CONFIG_DIR = parent_dir / "config"
-
 
 @pytest.mark.parametrize(
     "filename",
@@ -20,11 +15,11 @@ CONFIG_DIR = parent_dir / "config"
         "ecosystem_config_micro.json",
     ],
 )
-def test_load_config_smoke(filename):
+def test_load_config_smoke(config_dir, filename):
     """
     Smoke test: ensure that loading a known good config file works without errors.
     """
-    config_path = CONFIG_DIR / filename
+    config_path = config_dir / filename
     if not config_path.exists():
         pytest.skip(f"Config file {filename} does not exist")
     config = load_config(config_path)
@@ -2,7 +2,7 @@
 Tests for the net worth configuration module.
 """
 
-from pathlib import Path
+import math
 
 import pytest
 from pydantic import ValidationError
@@ -14,13 +14,10 @@ from world_builder.distributions_config import (
     TruncatedNormalDist,
     FunctionBasedDist,
     FunctionConfig,
+    LinearParams,
     NoiseFunctionConfig,
 )
 
-parent_dir = Path(__file__).resolve().parent
-CONFIG_DIR = parent_dir / "config"
-CONFIG_FILE = CONFIG_DIR / "nw_config_micro.json"
-
 
 @pytest.mark.parametrize(
     "filename",
@@ -29,11 +26,11 @@ CONFIG_FILE = CONFIG_DIR / "nw_config_micro.json"
         "nw_config_large.json",
     ],  # known good configs -- should pass
 )
-def test_load_config_smoke(filename):
+def test_load_config_smoke(config_dir, filename):
     """
     Smoke test: ensure that loading a known good config file works without errors.
     """
-    config_path = CONFIG_DIR / filename
+    config_path = config_dir / filename
     config = load_config(config_path)
     assert config is not None
 
@@ -243,12 +240,40 @@ def test_function_types():
         assert isinstance(dist.noise_function, NoiseFunctionConfig)
 
 
-def test_load_large_config():
+@pytest.mark.parametrize(
+    "function_config,x,expected",
+    [
+        ({"type": "constant", "params": {"value": 7}}, 3, 7),
+        ({"type": "linear", "params": {"slope": 5, "intercept": 100}}, 30, 250),
+        ({"type": "exponential", "params": {"base": 2, "rate": 0.1}}, 10, 2 * math.e),
+        ({"type": "quadratic", "params": {"a": 1, "b": 2, "c": 3}}, 2, 11),
+    ],
+)
+def test_function_config_compile(function_config, x, expected):
+    """
+    Test that compiled functions evaluate correctly.
+    """
+    func = FunctionConfig(**function_config)
+    assert func.compile()(x) == pytest.approx(expected)
+
+
+def test_function_config_compile_after_model_copy():
+    """
+    Test that a copy with updated params compiles to the updated function.
+    """
+    func = FunctionConfig(type="linear", params=LinearParams(slope=1, intercept=0))
+    assert func.compile()(2) == pytest.approx(2)
+    updated = func.model_copy(update={"params": LinearParams(slope=10, intercept=0)})
+    assert updated.compile()(2) == pytest.approx(20)
+    assert func.compile()(2) == pytest.approx(2)
+
+
+def test_load_large_config(config_dir):
     """
     Test loading and validating the large config file specifically.
     This test verifies the structure and content of the large config file.
     """
-    config_path = CONFIG_DIR / "nw_config_large.json"
+    config_path = config_dir / "nw_config_large.json"
     config = load_config(config_path)
 
     # Test basic structure
@@ -287,11 +312,11 @@ def test_load_large_config():
         assert "scale_factor" in dist.noise_function.params
 
 
-def test_load_config_with_primary_residence():
+def test_load_config_with_primary_residence(config_dir):
     """
     Test loading a config file that includes the optional primary residence fields.
     """
-    config_path = CONFIG_DIR / "nw_config_small.json"
+    config_path = config_dir / "nw_config_small.json"
     config = load_config(config_path)
 
     # Test basic structure
@@ -322,11 +347,11 @@ def test_load_config_with_primary_residence():
     assert value_config.noise_function.params["scale_factor"].params.intercept == 5000
 
 
-def test_load_config_with_all_assets():
+def test_load_config_with_all_assets(config_dir):
     """
     Test loading a config file that includes all the optional asset fields.
     """
-    config_path = CONFIG_DIR / "nw_config_small.json"
+    config_path = config_dir / "nw_config_small.json"
     config = load_config(config_path)
 
     # Test basic structure
@@ -1,18 +1,22 @@
-from pathlib import Path
-
 import pytest
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from world_builder.population.config import load_config, PopulationConfig
 from world_builder.distributions_config import (
+    BernoulliBasedDist,
+    Distribution,
     DistributionTransformOperation,
+    FunctionBasedDist,
+    LogNormalDist,
     NormalDist,
+    TruncatedNormalDist,
     is_distribution,
 )
 
-parent_dir = Path(__file__).resolve().parent
-CONFIG_DIR = parent_dir / "config"
-CONFIG_FILE = CONFIG_DIR / "wb_config_micro.json"
+# Built once so every parametrized case reuses the same validator
+POPULATION_CONFIG_ADAPTER = TypeAdapter(PopulationConfig)
+DISTRIBUTION_ADAPTER = TypeAdapter(Distribution)
+NORMAL_AGE = NormalDist.model_construct(type="normal", mean=30, std=5)
 
 
 @pytest.mark.parametrize(
@@ -24,11 +28,11 @@ CONFIG_FILE = CONFIG_DIR / "wb_config_micro.json"
         "wb_config_large.json",
     ],  # known good configs -- should pass
 )
-def test_load_config_smoke(filename):
+def test_load_config_smoke(config_dir, filename):
     """
     Smoke test: ensure that loading a known good config file works without errors.
     """
-    config_path = CONFIG_DIR / filename
+    config_path = config_dir / filename
     config = load_config(config_path)
     assert config is not None
 
@@ -39,11 +43,11 @@ def test_load_config_smoke(filename):
         "wb_config_bad_weights_profession.json"
     ],  # intentionally broken config -- profession weights don't sum to 1.0
 )
-def test_load_config_bad_weights(filename):
+def test_load_config_bad_weights(config_dir, filename):
     """
     Test that loading a config with invalid weights fails validation.
     """
-    config_path = CONFIG_DIR / filename
+    config_path = config_dir / filename
 
     with pytest.raises(ValidationError):
         _ = load_config(config_path)
@@ -55,20 +59,50 @@ def test_load_config_bad_weights(filename):
         "wb_config_bad_factors.json"
     ],  # intentionally broken config -- factors are negative
 )
-def test_load_config_bad_factors(filename):
+def test_load_config_bad_factors(config_dir, filename):
     """
     Test that loading a config with invalid factors fails validation.
     """
-    config_path = CONFIG_DIR / filename
+    config_path = config_dir / filename
     with pytest.raises(ValidationError):
         _ = load_config(config_path)
 
 
+@pytest.mark.parametrize(
+    "contents",
+    [
+        b'{"base_probabilities_finite": {',  # truncated JSON
+        b"\xff\xfe{}",  # not valid UTF-8
+    ],
+    ids=["truncated", "invalid_utf8"],
+)
+def test_load_config_malformed_json(tmp_path, contents):
+    """
+    Test that loading a file that isn't valid JSON raises a ValueError.
+    """
+    config_path = tmp_path / "config.json"
+    config_path.write_bytes(contents)
+    with pytest.raises(ValueError, match="Tried to load") as exc_info:
+        _ = load_config(config_path)
+    # ValidationError subclasses ValueError, so check it was translated
+    assert not isinstance(exc_info.value, ValidationError)
+
+
+def test_load_config_non_object_json(tmp_path):
+    """
+    Test that valid JSON which isn't an object fails validation.
+    """
+    config_path = tmp_path / "config.json"
+    config_path.write_text("[]")
+    with pytest.raises(ValidationError, match="model_type"):
+        _ = load_config(config_path)
+
+
 # the below tests are for PopulationConfig directly, without loading a file
 # this enables us to more granually tweak options without burdening the codebase with a multiplicity of config files
 
 # Valid configurations should use the new schema keys:
-good_configs = [
+good_configs: tuple[dict, ...] = (
     # test for data without factors
     {
         "base_probabilities_finite": {
@@ -98,10 +132,10 @@ good_configs = [
         "factors": {"city": {"allegiance": {"Mos Eisley": {"Rebel": 2.0}}}},
         "metadata": {"planet": "Tatooine"},
     },
-]
+)
 
 # Invalid configurations should trigger validation errors:
-bad_configs = [
+bad_configs: tuple[dict, ...] = (
     # base probabilities sum != 1.0
     {
         "base_probabilities_finite": {
@@ -194,7 +228,7 @@ bad_configs = [
         },
         "metadata": {"planet": "Tatooine"},
     },
-]
+)
 
 
 @pytest.mark.parametrize("config_data", good_configs)
@@ -203,25 +237,73 @@ def test_populationconfig_valid(config_data):
     Valid PopulationConfig data should instantiate without errors,
     and retain the correct structure.
     """
-    config = PopulationConfig(**config_data)
+    config = POPULATION_CONFIG_ADAPTER.validate_python(config_data)
     # finite probabilities
     assert config.base_probabilities_finite == config_data["base_probabilities_finite"]
     # distributions loaded as Distribution instances
-    assert set(config.base_probabilities_distributions.keys()) == set(
-        config_data["base_probabilities_distributions"].keys()
+    assert (
+        config.base_probabilities_distributions.keys()
+        == config_data["base_probabilities_distributions"].keys()
+    )
+    assert all(
+        is_distribution(dist)
+        for dist in config.base_probabilities_distributions.values()
     )
-    for key, dist in config.base_probabilities_distributions.items():
-            assert is_distribution(dist)
     assert config.metadata["planet"] == "Tatooine"
 
 
+LINEAR_AGE = {"type": "linear", "params": {"slope": 0.01, "intercept": 0.1}}
+
+
+@pytest.mark.parametrize(
+    "dist_data,expected_cls",
+    [
+        ({"type": "normal", "mean": 35, "std": 20}, NormalDist),
+        ({"type": "lognormal", "mean": 3, "std": 0.5}, LogNormalDist),
+        (
+            {"type": "truncated_normal", "mean": 35, "std": 20, "lower": 0},
+            TruncatedNormalDist,
+        ),
+        (
+            {
+                "field_name": "age",
+                "mean_function": LINEAR_AGE,
+                "noise_function": {
+                    "type": "normal",
+                    "params": {"field_name": "age", "scale_factor": LINEAR_AGE},
+                },
+            },
+            FunctionBasedDist,
+        ),
+        ({"field_name": "age", "mean_function": LINEAR_AGE}, BernoulliBasedDist),
+    ],
+)
+def test_distribution_discriminator(dist_data, expected_cls):
+    """
+    Distribution dicts should validate straight to the member their shape tags.
+    """
+    dist = DISTRIBUTION_ADAPTER.validate_python(dist_data)
+    assert isinstance(dist, expected_cls)
+
+
+def test_distribution_discriminator_unknown_type():
+    """
+    An unknown distribution type should be rejected by the discriminator.
+    """
+    with pytest.raises(ValidationError, match="union_tag_invalid"):
+        DISTRIBUTION_ADAPTER.validate_python({"type": "uniform", "low": 0, "high": 1})
+
+
 @pytest.mark.parametrize("config_data", bad_configs)
 def test_populationconfig_invalid(config_data):
     """
     Invalid PopulationConfig data should raise a ValidationError.
+
+    Validated in lax mode, as load_config does, so a case can't pass just because
+    strict mode refuses a coercion that production accepts.
     """
     with pytest.raises(ValidationError):
-        PopulationConfig(**config_data)
+        POPULATION_CONFIG_ADAPTER.validate_python(config_data)
 
 
 @pytest.mark.parametrize(
@@ -260,7 +342,7 @@ def test_populationconfig_invalid(config_data):
     ],
 )
 def test_valid_override_distributions(config_json):
-    config = PopulationConfig(**config_json)
+    config = POPULATION_CONFIG_ADAPTER.validate_python(config_json)
     assert config.override_distributions is not None
 
 
@@ -299,8 +381,12 @@ def test_valid_override_distributions(config_json):
 )
 def test_invalid_override_distributions(config_json):
     with pytest.raises(ValidationError) as exc_info:
-        PopulationConfig(**config_json)
-    assert "override" in str(exc_info.value).lower()
+        POPULATION_CONFIG_ADAPTER.validate_python(config_json)
+    errs = exc_info.value.errors(include_url=False, include_context=False)
+    assert any(
+        "override" in str(e["loc"]).lower() or "override" in e["msg"].lower()
+        for e in errs
+    )
 
 
 @pytest.mark.parametrize(
@@ -332,9 +418,7 @@ def test_invalid_override_distributions(config_json):
 def test_valid_transform_distributions(transform_distributions):
     config = PopulationConfig(
         base_probabilities_finite={},
-        base_probabilities_distributions={
-            "age": NormalDist(type="normal", mean=30, std=5)
-        },
+        base_probabilities_distributions={"age": NORMAL_AGE},
         factors={},
         override_distributions=[],
         transform_distributions=transform_distributions,
@@ -376,9 +460,7 @@ def test_invalid_transform_distributions(transform_distributions):
     with pytest.raises(ValidationError):
         PopulationConfig(
             base_probabilities_finite={},
-            base_probabilities_distributions={
-                "age": NormalDist(type="normal", mean=30, std=5)
-            },
+            base_probabilities_distributions={"age": NORMAL_AGE},
             factors={},
             override_distributions=[],
             transform_distributions=transform_distributions,
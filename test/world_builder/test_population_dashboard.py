@@ -1,27 +1,37 @@
+from functools import cache
+
+import numpy as np
 import pytest
 import pandas as pd
 
 from unittest.mock import patch
 
-from world_builder.population import dashboard as population_dashboard
+
+@cache
+def _get_dashboard():
+    """Import the Streamlit dashboard on first use rather than at collection time."""
+    from world_builder.population import dashboard
+
+    return dashboard
 
 
-@pytest.fixture
-def example_dataframe(tmp_path):
-    """Create a real Parquet file for testing load_data()."""
+@pytest.fixture(scope="session")
+def example_dataframe(tmp_path_factory):
+    """Create a real Parquet file for testing load_data(), written once per session."""
     df = pd.DataFrame(
         {
-            "first_name": ["Ahsoka", "Padmé", "Obi-Wan"],
-            "surname": ["Tano", "Naberrie", "Kenobi"],
-            "species": ["Togruta", "Human", "Human"],
-            "gender": ["female", "female", "male"],
-            "age": [17, 27, 35],
-            "allegiance": ["Rebel", "Republic", "Jedi"],
-            "character_id": ["abc", "def", "ghi"],
+            "first_name": np.array(["Ahsoka", "Padmé", "Obi-Wan"], dtype=object),
+            "surname": np.array(["Tano", "Naberrie", "Kenobi"], dtype=object),
+            "species": np.array(["Togruta", "Human", "Human"], dtype=object),
+            "gender": np.array(["female", "female", "male"], dtype=object),
+            "age": np.array([17, 27, 35], dtype=np.int64),
+            "allegiance": np.array(["Rebel", "Republic", "Jedi"], dtype=object),
+            "character_id": np.array(["abc", "def", "ghi"], dtype=object),
         }
     )
-    parquet_path = tmp_path / "population.parquet"
-    df.to_parquet(parquet_path)
+    parquet_path = tmp_path_factory.mktemp("dashboard") / "population.parquet"
+    # Three rows aren't worth compressing
+    df.to_parquet(parquet_path, engine="pyarrow", compression=None)
     return parquet_path
 
 
@@ -31,8 +41,11 @@ def test_main_smoke_with_real_dataframe(monkeypatch, example_dataframe):
     and confirm it executes end-to-end with no exceptions.
     """
     # Override the file path used by load_data()
+    population_dashboard = _get_dashboard()
     monkeypatch.setattr(
-        population_dashboard, "load_data", lambda: pd.read_parquet(example_dataframe)
+        population_dashboard,
+        "load_data",
+        lambda: pd.read_parquet(example_dataframe, engine="pyarrow"),
     )
 
     # Run the Streamlit logic end-to-end (not as a server, just functionally)